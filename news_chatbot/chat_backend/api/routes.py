@@ -1,27 +1,51 @@
+import asyncio
 import json
-from typing import Dict, Any
-from fastapi import APIRouter
+import os
+import re
+import time
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from agents import Runner
 from openai.types.responses import ResponseTextDeltaEvent
 from loguru import logger
 
-from business_agents.agents.news_agent import create_news_agent
+from business_agents.agents.news_agent import create_fast_agent, create_news_agent
 from business_agents.agents.agent_definitions import get_agents
+from business_agents.batch import run_batch
+from business_agents.briefings import briefing_store
+from business_agents.turn_router import (
+    BRIEFING_ROUTE, FAST_ROUTE, classify_turn, record_route, route_report
+)
+from utils.history import SessionHistory
+from utils.log import TRACE_HEADER, new_trace_id, trace_sampled
+from utils.settings import settings
 
 router = APIRouter()
 
+# Yield control back to the event loop every N serialized lines
+NDJSON_YIELD_EVERY = 100
+
+NDJSON_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
 # Session cache: stores agent and message history per session
 session_cache: Dict[str, Dict[str, Any]] = {}
 
+# SSE streams currently being generated by this worker
+active_streams = 0
+
 
 def get_or_create_session(session_id: str, system_prompt: str = None) -> Dict[str, Any]:
     if session_id not in session_cache:
         logger.info(f"Creating new session: {session_id}, custom_prompt: {system_prompt is not None}")
         session_cache[session_id] = {
             "agent": create_news_agent(system_prompt),
-            "messages": []
+            "fast_agent": create_fast_agent(system_prompt),
+            "messages": SessionHistory()
         }
     return session_cache[session_id]
 
@@ -38,11 +62,39 @@ class ChatRequest(BaseModel):
     session_id: str
     history: list[dict] = []
     system_prompt: str = None
+    # Speculative turns read the session history but do not append to it;
+    # the caller commits the turn with POST /session/{session_id}/commit
+    speculative: bool = False
+
+
+class CommitTurnRequest(BaseModel):
+    # Either side may be sent on its own: the user message when a speculative
+    # run is accepted, the response once it has been fully spoken
+    message: str = ""
+    response: str = ""
+
+
+class BatchJob(BaseModel):
+    agent_id: str
+    prompt: str
+
+
+class BatchRequest(BaseModel):
+    jobs: list[BatchJob]
+    # May lower the server's BATCH_CONCURRENCY, never raise it
+    concurrency: Optional[int] = Field(None, ge=1)
 
 
 @router.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "chat_backend"}
+    return {
+        "status": "healthy",
+        "service": "chat_backend",
+        "pid": os.getpid(),
+        "sessions": len(session_cache),
+        "active_streams": active_streams,
+        "routes": route_report(),
+    }
 
 
 @router.get("/agents")
@@ -50,44 +102,91 @@ async def list_agents():
     return {"agents": get_agents()}
 
 
+@router.get("/briefings")
+async def list_briefings():
+    """Precomputed briefing freshness and hit counts."""
+    return briefing_store.status()
+
+
 @router.post("/chat/stream")
-async def stream_chat(request: ChatRequest):
+async def stream_chat(request: ChatRequest, x_trace_id: Optional[str] = Header(None, alias=TRACE_HEADER)):
+    trace_id = x_trace_id or new_trace_id()
+    log = logger.bind(trace_id=trace_id)
+    log_request = trace_sampled(trace_id, settings.log_request_sample_rate)
+
     async def generate():
+        global active_streams
+        active_streams += 1
+        started = time.perf_counter()
         try:
             # Get or create cached session
             session = get_or_create_session(request.session_id, request.system_prompt)
-            agent = session["agent"]
             messages = session["messages"]
+            previous_reply = messages.last_content("assistant")
 
             # Add new user message to history
-            messages.append({"role": "user", "content": request.message})
-
-            logger.info(f"Session {request.session_id}: {len(messages)} messages")
+            if request.speculative:
+                agent_input = messages.to_input() + [{"role": "user", "content": request.message}]
+            else:
+                messages.append("user", request.message)
+                agent_input = messages.to_input()
+
+            if log_request:
+                log.info("Session {}: {} messages, speculative: {}",
+                         request.session_id, len(agent_input), request.speculative)
+
+            # Fast path: answer from a precomputed briefing when the turn matches one
+            briefing = briefing_store.lookup(request.system_prompt, request.message)
+            if briefing:
+                for sentence in re.findall(r"[^.!?]+[.!?]*\s*", briefing):
+                    data = json.dumps({"type": "text", "content": sentence})
+                    yield f"data: {data}\n\n"
+                if not request.speculative:
+                    messages.append("assistant", briefing)
+                done_data = json.dumps({"type": "done", "session_id": request.session_id})
+                yield f"data: {done_data}\n\n"
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                record_route(BRIEFING_ROUTE, elapsed_ms, elapsed_ms)
+                return
+
+            # Trivial turns go to the tool-free fast agent
+            route = classify_turn(request.message, previous_reply)
+            agent = session["fast_agent"] if route == FAST_ROUTE else session["agent"]
 
             # Pass messages to agent
-            result = Runner.run_streamed(agent, input=messages)
+            result = Runner.run_streamed(agent, input=agent_input)
 
             full_response = []
+            first_token_ms = None
             async for event in result.stream_events():
                 if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
                     chunk = event.data.delta
                     if chunk:
+                        if first_token_ms is None:
+                            first_token_ms = (time.perf_counter() - started) * 1000
                         full_response.append(chunk)
                         data = json.dumps({"type": "text", "content": chunk})
                         yield f"data: {data}\n\n"
 
             # Add assistant response to history
-            if full_response:
-                messages.append({"role": "assistant", "content": "".join(full_response)})
+            if full_response and not request.speculative:
+                messages.append("assistant", "".join(full_response))
 
             done_data = json.dumps({"type": "done", "session_id": request.session_id})
             yield f"data: {done_data}\n\n"
-            logger.info(f"Completed response for session {request.session_id}")
+
+            total_ms = (time.perf_counter() - started) * 1000
+            record_route(route, first_token_ms or total_ms, total_ms)
+            if log_request:
+                log.info("Completed response for session {} via {} route ({}): first token {:.0f} ms, total {:.0f} ms",
+                         request.session_id, route, agent.model, first_token_ms or total_ms, total_ms)
 
         except Exception as e:
-            logger.error(f"Stream error: {e}", exc_info=True)
+            log.opt(exception=e).error("Stream error: {}", e)
             error_data = json.dumps({"type": "error", "error": str(e)})
             yield f"data: {error_data}\n\n"
+        finally:
+            active_streams -= 1
 
     return StreamingResponse(
         generate(),
@@ -95,39 +194,82 @@ async def stream_chat(request: ChatRequest):
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
+            "X-Accel-Buffering": "no",
+            TRACE_HEADER: trace_id
         }
     )
 
 
 @router.post("/chat")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, x_trace_id: Optional[str] = Header(None, alias=TRACE_HEADER)):
+    trace_id = x_trace_id or new_trace_id()
+    log = logger.bind(trace_id=trace_id)
+    log_request = trace_sampled(trace_id, settings.log_request_sample_rate)
+    started = time.perf_counter()
     try:
         # Get or create cached session
         session = get_or_create_session(request.session_id, request.system_prompt)
-        agent = session["agent"]
         messages = session["messages"]
+        previous_reply = messages.last_content("assistant")
 
         # Add new user message to history
-        messages.append({"role": "user", "content": request.message})
+        messages.append("user", request.message)
 
-        logger.info(f"Session {request.session_id}: {len(messages)} messages")
+        if log_request:
+            log.info("Session {}: {} messages", request.session_id, len(messages))
 
-        result = await Runner.run(agent, input=messages)
-        response_text = result.final_output
+        route = BRIEFING_ROUTE
+        response_text = briefing_store.lookup(request.system_prompt, request.message)
+        if not response_text:
+            # Trivial turns go to the tool-free fast agent
+            route = classify_turn(request.message, previous_reply)
+            agent = session["fast_agent"] if route == FAST_ROUTE else session["agent"]
+            result = await Runner.run(agent, input=messages.to_input())
+            response_text = result.final_output
 
         # Add assistant response to history
         if response_text:
-            messages.append({"role": "assistant", "content": response_text})
+            messages.append("assistant", response_text)
 
-        logger.info(f"Completed response for session {request.session_id}")
+        total_ms = (time.perf_counter() - started) * 1000
+        record_route(route, total_ms, total_ms)
+        if log_request:
+            log.info("Completed response for session {} via {} route in {:.0f} ms",
+                     request.session_id, route, total_ms)
         return {"response": response_text, "session_id": request.session_id}
 
     except Exception as e:
-        logger.error(f"Chat error: {e}", exc_info=True)
+        log.opt(exception=e).error("Chat error: {}", e)
         return {"response": f"Error: {str(e)}", "session_id": request.session_id}
 
 
+@router.post("/chat/batch")
+async def chat_batch(request: BatchRequest):
+    """Run many single-turn jobs and stream results as NDJSON as each one finishes."""
+    concurrency = min(request.concurrency or settings.batch_concurrency, settings.batch_concurrency)
+    jobs = [job.model_dump() for job in request.jobs]
+    logger.info(f"Batch request: {len(jobs)} jobs, concurrency {concurrency}")
+
+    async def generate():
+        async for result in run_batch(jobs, concurrency):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson", headers=NDJSON_HEADERS)
+
+
+@router.post("/session/{session_id}/commit")
+async def commit_turn(session_id: str, request: CommitTurnRequest):
+    """Append a speculative turn that the caller decided to keep."""
+    if session_id not in session_cache:
+        return {"error": "Session not found", "session_id": session_id}
+    messages = session_cache[session_id]["messages"]
+    if request.message:
+        messages.append("user", request.message)
+    if request.response:
+        messages.append("assistant", request.response)
+    return {"status": "committed", "session_id": session_id, "message_count": len(messages)}
+
+
 @router.delete("/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete a session and free resources."""
@@ -136,13 +278,61 @@ async def delete_session(session_id: str):
 
 
 @router.get("/session/{session_id}")
-async def get_session_info(session_id: str):
-    """Get session info."""
+async def get_session_info(
+    session_id: str,
+    cursor: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Get session info with one page of messages."""
     if session_id in session_cache:
-        session = session_cache[session_id]
+        messages = session_cache[session_id]["messages"]
         return {
             "session_id": session_id,
-            "message_count": len(session["messages"]),
-            "messages": session["messages"]
+            "message_count": len(messages),
+            **messages.page(cursor, limit)
         }
     return {"error": "Session not found", "session_id": session_id}
+
+
+@router.get("/session/{session_id}/messages")
+async def stream_session_messages(
+    session_id: str,
+    cursor: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """Stream a session's messages as NDJSON, starting at `cursor`."""
+    if session_id not in session_cache:
+        return {"error": "Session not found", "session_id": session_id}
+
+    messages = session_cache[session_id]["messages"]
+    stop = cursor + limit if limit else len(messages)
+
+    async def generate():
+        for count, message in enumerate(messages.iter_messages(cursor, stop), start=1):
+            yield json.dumps(message) + "\n"
+            if count % NDJSON_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson", headers=NDJSON_HEADERS)
+
+
+@router.get("/sessions/export")
+async def export_sessions():
+    """Stream every cached session as NDJSON, one message per line."""
+    # Snapshot the ids only; sessions are read one at a time while streaming
+    session_ids = list(session_cache.keys())
+
+    async def generate():
+        count = 0
+        for session_id in session_ids:
+            session = session_cache.get(session_id)
+            if session is None:
+                continue
+            for index, message in enumerate(session["messages"].iter_messages()):
+                yield json.dumps({"session_id": session_id, "index": index, **message}) + "\n"
+                count += 1
+                if count % NDJSON_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+        logger.info(f"Exported {count} messages from {len(session_ids)} sessions")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson", headers=NDJSON_HEADERS)
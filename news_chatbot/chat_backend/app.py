@@ -1,17 +1,39 @@
+import asyncio
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from api.routes import router
+from business_agents.briefings import briefing_store
 from utils.settings import settings
+from utils.log import setup_logging
+
+setup_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info(f"Chat backend starting on {settings.host}:{settings.port}")
+
+    briefing_task = None
+    if settings.briefings_enabled and settings.briefing_scheduler:
+        briefing_task = asyncio.create_task(
+            briefing_store.run_scheduler(settings.briefing_refresh_seconds, settings.briefing_shared_path)
+        )
+        logger.info(f"Briefing scheduler started for topics: {list(briefing_store.topics)}")
+    elif settings.briefings_enabled and settings.briefing_shared_path:
+        briefing_task = asyncio.create_task(
+            briefing_store.run_follower(settings.briefing_shared_path)
+        )
+        logger.info(f"Following shared briefings from {settings.briefing_shared_path}")
+
     yield
+
+    if briefing_task:
+        briefing_task.cancel()
     logger.info("Chat backend shutting down")
+    await logger.complete()
 
 
 app = FastAPI(
@@ -1,5 +1,7 @@
 from agents import Agent, WebSearchTool
 
+from utils.settings import settings
+
 NEWS_AGENT_INSTRUCTIONS = """You are a helpful news assistant that provides the latest news updates.
 
 Your role:
@@ -14,6 +16,12 @@ Your output will be converted to audio so don't include special characters in yo
 Be conversational and concise. Keep responses brief and clear.
 """
 
+FAST_AGENT_INSTRUCTIONS = """
+This turn is conversational (a greeting, thanks, small talk, or a request to repeat something).
+Web search is not available for it. Reply in one or two short sentences, and if asked to repeat,
+repeat your previous answer.
+"""
+
 
 def create_news_agent(system_prompt: str = None) -> Agent:
     instructions = system_prompt if system_prompt else NEWS_AGENT_INSTRUCTIONS
@@ -21,5 +29,15 @@ def create_news_agent(system_prompt: str = None) -> Agent:
         name="NewsBot",
         instructions=instructions,
         tools=[WebSearchTool()],
-        model="gpt-4o",
+        model=settings.openai_model,
+    )
+
+
+def create_fast_agent(system_prompt: str = None) -> Agent:
+    """Tool-free agent on the smaller model, for greetings, thanks and small talk."""
+    instructions = system_prompt if system_prompt else NEWS_AGENT_INSTRUCTIONS
+    return Agent(
+        name="NewsBot",
+        instructions=instructions + FAST_AGENT_INSTRUCTIONS,
+        model=settings.fast_model,
     )
@@ -0,0 +1,98 @@
+"""Batch runner for offline digest generation.
+
+Runs many (agent id, prompt) jobs with bounded concurrency. Jobs never touch
+the interactive session cache: each one is a single-turn run on a shared,
+stateless agent instance.
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from agents import Agent, Runner
+from loguru import logger
+
+from business_agents.agents.agent_definitions import get_agent_by_id
+from business_agents.agents.news_agent import create_news_agent
+
+# One agent instance per agent id, shared by every batch job
+_agents: Dict[str, Agent] = {}
+
+
+def get_shared_agent(agent_id: str) -> Agent:
+    if agent_id not in _agents:
+        definition = get_agent_by_id(agent_id)
+        if definition is None:
+            raise ValueError(f"Unknown agent: {agent_id}")
+        _agents[agent_id] = create_news_agent(definition["prompt"])
+    return _agents[agent_id]
+
+
+def _usage(result) -> Dict[str, int]:
+    usage = result.context_wrapper.usage
+    return {
+        "requests": usage.requests,
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+
+
+async def _run_prompt(agent_id: str, prompt: str) -> Dict[str, Any]:
+    agent = get_shared_agent(agent_id)
+    started = time.perf_counter()
+    result = await Runner.run(agent, input=prompt)
+    return {
+        "response": result.final_output,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "usage": _usage(result),
+    }
+
+
+async def run_batch(jobs: List[Dict[str, str]], concurrency: int) -> AsyncIterator[Dict[str, Any]]:
+    """Run jobs concurrently and yield one result per job as it finishes.
+
+    Identical (agent id, prompt) pairs within a batch share a single run, so
+    repeated topics are only searched and summarized once. Only the first job
+    of a pair reports latency and usage; the others carry the response plus
+    ``deduplicated_of`` (that job's index), so summing usage never double counts.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    runs: Dict[Tuple[str, str], asyncio.Task] = {}
+    owners: Dict[Tuple[str, str], int] = {}
+
+    async def bounded_run(agent_id: str, prompt: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _run_prompt(agent_id, prompt)
+
+    async def run_job(index: int, job: Dict[str, str]) -> Dict[str, Any]:
+        agent_id = job.get("agent_id") if isinstance(job, dict) else None
+        try:
+            # A malformed job fails on its own instead of cancelling the whole batch
+            if not isinstance(job, dict) or not isinstance(job.get("agent_id"), str) \
+                    or not isinstance(job.get("prompt"), str):
+                raise ValueError("Job must be an object with string agent_id and prompt")
+            prompt = job["prompt"]
+            key = (agent_id, prompt)
+            if key not in runs:
+                runs[key] = asyncio.create_task(bounded_run(agent_id, prompt))
+                owners[key] = index
+            output = await asyncio.shield(runs[key])
+            if owners[key] != index:
+                output = {"response": output["response"], "deduplicated_of": owners[key]}
+            return {"index": index, "agent_id": agent_id, "status": "ok", **output}
+        except Exception as e:
+            logger.error(f"Batch job {index} ({agent_id}) failed: {e}")
+            return {"index": index, "agent_id": agent_id, "status": "error", "error": str(e)}
+
+    tasks = [asyncio.create_task(run_job(index, job)) for index, job in enumerate(jobs)]
+    started = time.perf_counter()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in [*tasks, *runs.values()]:
+            task.cancel()
+        logger.info(
+            f"Batch of {len(jobs)} jobs ({len(runs)} unique) finished in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
@@ -0,0 +1,192 @@
+"""Precomputed news briefings.
+
+A background scheduler refreshes one briefing per (persona, topic) pair. Chat
+turns that clearly ask for one of those topics are answered straight from the
+store instead of running a fresh search and summary.
+
+Under serve.py only one worker runs the scheduler. It publishes each refresh
+to a shared JSON file that the other workers poll, so every briefing is
+generated once per interval no matter how many workers there are.
+"""
+import asyncio
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from business_agents.agents.agent_definitions import AGENTS
+from business_agents.agents.news_agent import NEWS_AGENT_INSTRUCTIONS
+from business_agents.batch import run_batch
+from utils.settings import settings
+
+# Optional conversational lead-in before a topic phrase, e.g. "tell me the"
+LEAD_IN = r"^(hey |so |ok |okay )?(can you |could you |please )?(tell me |give me |read me |any |what are |what's |whats |what is )?(the |today's |todays )?"
+
+BRIEFING_TOPICS = {
+    "top-stories": {
+        "prompt": "Give me a short spoken briefing of today's top news stories.",
+        "pattern": r"^(what'?s|what is) (happening|going on|new)( today| right now| in the world)?$"
+                   r"|" + LEAD_IN + r"((top|latest|breaking) )?(news|stories|headlines)( today| for today)?$",
+    },
+    "tech": {
+        "prompt": "Give me a short spoken briefing of today's top technology news.",
+        "pattern": LEAD_IN + r"((top|latest) )?(tech|technology) (news|headlines|stories)( today)?$",
+    },
+    "markets": {
+        "prompt": "Give me a short spoken briefing of how the stock markets are doing today.",
+        "pattern": LEAD_IN + r"(stock )?markets?( news| today| update)?$"
+                   r"|^how (are|is) the (stock )?markets?( doing)?( today)?$",
+    },
+}
+
+# Matched turns must be short; longer turns usually carry a more specific question
+MAX_MATCH_WORDS = 10
+
+# How often non-scheduling workers check the shared briefings file
+SHARED_POLL_SECONDS = 15
+
+
+class BriefingStore:
+    def __init__(self, topics: list[str], max_age_seconds: int):
+        self.topics = {topic: BRIEFING_TOPICS[topic] for topic in topics if topic in BRIEFING_TOPICS}
+        self.max_age_seconds = max_age_seconds
+        self.patterns = {
+            topic: re.compile(config["pattern"]) for topic, config in self.topics.items()
+        }
+        self.personas = {agent["prompt"]: agent["id"] for agent in AGENTS}
+        self.briefings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+        self._loaded_mtime: Optional[float] = None
+
+    def persona_for_prompt(self, system_prompt: Optional[str]) -> Optional[str]:
+        return self.personas.get(system_prompt or NEWS_AGENT_INSTRUCTIONS)
+
+    def match_topic(self, message: str) -> Optional[str]:
+        text = message.strip().lower().replace("\u2019", "'").rstrip("?.!")
+        if len(text.split()) > MAX_MATCH_WORDS:
+            return None
+        for topic, pattern in self.patterns.items():
+            if pattern.search(text):
+                return topic
+        return None
+
+    def lookup(self, system_prompt: Optional[str], message: str) -> Optional[str]:
+        """Return a fresh briefing for this turn, or None to run the agent."""
+        persona = self.persona_for_prompt(system_prompt)
+        topic = self.match_topic(message) if persona else None
+        if topic is None:
+            return None
+
+        entry = self.briefings.get((persona, topic))
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if time.time() - entry["generated_at"] > self.max_age_seconds:
+            self.stats["stale"] += 1
+            return None
+
+        entry["hits"] += 1
+        self.stats["hits"] += 1
+        logger.info(f"Serving precomputed briefing {persona}/{topic}")
+        return entry["text"]
+
+    async def refresh(self):
+        jobs = [
+            {"agent_id": agent["id"], "prompt": config["prompt"]}
+            for agent in AGENTS
+            for config in self.topics.values()
+        ]
+        keys = [(agent["id"], topic) for agent in AGENTS for topic in self.topics]
+        started = time.perf_counter()
+
+        async for result in run_batch(jobs, settings.batch_concurrency):
+            key = keys[result["index"]]
+            if result["status"] != "ok" or not result["response"]:
+                logger.warning(f"Briefing refresh failed for {key}: {result.get('error')}")
+                continue
+            previous = self.briefings.get(key)
+            self.briefings[key] = {
+                "text": result["response"],
+                "generated_at": time.time(),
+                "hits": previous["hits"] if previous else 0,
+            }
+
+        logger.info(f"Refreshed {len(jobs)} briefings in {time.perf_counter() - started:.1f}s")
+
+    def save(self, path: str):
+        """Publish the current briefings for other workers."""
+        entries = [
+            {"agent_id": persona, "topic": topic, "text": entry["text"], "generated_at": entry["generated_at"]}
+            for (persona, topic), entry in self.briefings.items()
+        ]
+        # Write then rename, so readers never see a partial file
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(entries, f)
+        os.replace(f"{path}.tmp", path)
+
+    def load(self, path: str) -> bool:
+        """Load briefings published by the scheduling worker, if the file changed."""
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._loaded_mtime:
+            return False
+
+        with open(path) as f:
+            entries = json.load(f)
+        for entry in entries:
+            key = (entry["agent_id"], entry["topic"])
+            previous = self.briefings.get(key)
+            self.briefings[key] = {
+                "text": entry["text"],
+                "generated_at": entry["generated_at"],
+                "hits": previous["hits"] if previous else 0,
+            }
+        self._loaded_mtime = mtime
+        return True
+
+    async def run_scheduler(self, interval_seconds: int, shared_path: str = ""):
+        while True:
+            try:
+                await self.refresh()
+                if shared_path:
+                    self.save(shared_path)
+            except Exception as e:
+                logger.error(f"Briefing refresh error: {e}", exc_info=True)
+            await asyncio.sleep(interval_seconds)
+
+    async def run_follower(self, shared_path: str):
+        while True:
+            try:
+                if self.load(shared_path):
+                    logger.info(f"Loaded {len(self.briefings)} shared briefings")
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Shared briefings load error: {e}")
+            await asyncio.sleep(SHARED_POLL_SECONDS)
+
+    def status(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            **self.stats,
+            "briefings": [
+                {
+                    "agent_id": persona,
+                    "topic": topic,
+                    "generated_at": entry["generated_at"],
+                    "age_seconds": round(now - entry["generated_at"], 1),
+                    "stale": now - entry["generated_at"] > self.max_age_seconds,
+                    "hits": entry["hits"],
+                }
+                for (persona, topic), entry in self.briefings.items()
+            ],
+        }
+
+
+briefing_store = BriefingStore(
+    topics=[topic.strip() for topic in settings.briefing_topics.split(",") if topic.strip()],
+    max_age_seconds=settings.briefing_max_age_seconds,
+)
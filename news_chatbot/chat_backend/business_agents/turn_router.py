@@ -0,0 +1,85 @@
+"""Local turn classifier for model routing.
+
+Short conversational turns (greetings, thanks, goodbyes, "repeat that",
+small talk) go to a tool-free agent on the smaller FAST_MODEL. Everything
+else, including any turn that mentions news or asks a factual question,
+goes to the full agent with web search. Bare "yes"/"no"/"ok" answers are
+left out on purpose: they usually accept a follow-up offer ("want more on
+the election?") that needs search. Classification is a single regex
+match, so it adds no network round trip.
+"""
+import re
+from typing import Any, Dict
+
+from utils.settings import settings
+
+FAST_ROUTE = "fast"
+FULL_ROUTE = "full"
+BRIEFING_ROUTE = "briefing"
+
+# Each phrase must make up the whole turn, alone or chained ("hi, how are you")
+FAST_PHRASES = [
+    # Greetings
+    r"(hi|hello|hey|hiya|yo|good (morning|afternoon|evening))( there)?( (newsbot|bot|you))?",
+    # Thanks and acknowledgements
+    r"(thanks|thank you|thx|cheers)( (so|very) much| a lot)?( for that)?",
+    r"(got it|cool|great|nice|awesome|perfect|i see)",
+    # Goodbyes
+    r"(bye|goodbye|bye bye|see you( later)?|talk (to you )?later|good night|that's all|that is all|nothing else|no thanks)",
+    # Repeat requests
+    r"((can|could) you |please )?(repeat|say) (that|it)( again)?( please)?",
+    r"(what did you say|sorry|pardon|come again|say again)",
+    # Small talk
+    r"how are you( doing)?( today)?|how's it going|who are you|what's your name|what is your name"
+    r"|what can you do|are you (there|real|a robot)",
+]
+
+FAST_PATTERN = re.compile(
+    r"^(oh |um |uh |well )?(" + "|".join(FAST_PHRASES) + r")( (" + "|".join(FAST_PHRASES) + r"))*$"
+)
+
+# Longer turns almost always carry a real question
+MAX_FAST_WORDS = 12
+
+# Aggregated per route for this worker; reported by /health
+route_stats: Dict[str, Dict[str, float]] = {
+    route: {"turns": 0, "first_token_ms_total": 0.0, "total_ms_total": 0.0}
+    for route in (FAST_ROUTE, FULL_ROUTE, BRIEFING_ROUTE)
+}
+
+
+def normalize_turn(message: str) -> str:
+    text = message.strip().lower().replace("’", "'")
+    return " ".join(re.sub(r"[^\w\s']", " ", text).split())
+
+
+def classify_turn(message: str, previous_reply: str = "") -> str:
+    """Return FAST_ROUTE for trivial conversational turns, FULL_ROUTE otherwise.
+
+    A turn that answers a question from the assistant ("want more on that?")
+    always takes the full route, whatever it says.
+    """
+    if not settings.fast_path_enabled or previous_reply.rstrip().endswith("?"):
+        return FULL_ROUTE
+    text = normalize_turn(message)
+    if not text or len(text.split()) > MAX_FAST_WORDS:
+        return FULL_ROUTE
+    return FAST_ROUTE if FAST_PATTERN.match(text) else FULL_ROUTE
+
+
+def record_route(route: str, first_token_ms: float, total_ms: float):
+    stats = route_stats[route]
+    stats["turns"] += 1
+    stats["first_token_ms_total"] += first_token_ms
+    stats["total_ms_total"] += total_ms
+
+
+def route_report() -> Dict[str, Any]:
+    return {
+        route: {
+            "turns": stats["turns"],
+            "avg_first_token_ms": round(stats["first_token_ms_total"] / stats["turns"], 1) if stats["turns"] else None,
+            "avg_total_ms": round(stats["total_ms_total"] / stats["turns"], 1) if stats["turns"] else None,
+        }
+        for route, stats in route_stats.items()
+    }
@@ -0,0 +1,42 @@
+"""Offline batch runner.
+
+Reads jobs as JSON lines of {"agent_id": ..., "prompt": ...} and writes one
+NDJSON result per job as it finishes.
+
+    uv run python run_batch.py jobs.jsonl --concurrency 8 > results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from business_agents.batch import run_batch
+from utils.settings import settings
+
+
+def parse_job(line: str):
+    # Lines that are not valid JSON are passed on and reported as error rows
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def load_jobs(path: str) -> list:
+    source = sys.stdin if path == "-" else open(path)
+    with source:
+        return [parse_job(line) for line in source if line.strip()]
+
+
+async def main(args: argparse.Namespace):
+    jobs = load_jobs(args.jobs)
+    async for result in run_batch(jobs, args.concurrency):
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run (agent_id, prompt) jobs in batch")
+    parser.add_argument("jobs", help="Path to a JSONL file of jobs, or - for stdin")
+    parser.add_argument("--concurrency", type=int, default=settings.batch_concurrency)
+    asyncio.run(main(parser.parse_args()))
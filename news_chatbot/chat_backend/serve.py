@@ -0,0 +1,128 @@
+"""Production launcher.
+
+With CHAT_BACKEND_WORKERS=1 this runs a single uvicorn server. With more,
+it starts that many uvicorn worker processes on local ports and serves the
+session-affinity router (server/router.py) on the public port. Workers that
+exit unexpectedly are restarted.
+
+On SIGTERM the router stops accepting connections and waits up to
+CHAT_BACKEND_DRAIN_TIMEOUT seconds for in-flight SSE streams. The workers
+are then stopped the same way.
+
+Only the first worker runs the briefing scheduler; it shares each refresh
+with the others through a JSON file in the temp directory.
+
+    uv run python serve.py
+"""
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+
+import uvicorn
+from loguru import logger
+
+from utils.settings import settings
+
+BRIEFING_SHARED_PATH = os.path.join(tempfile.gettempdir(), f"chat_backend_briefings_{os.getpid()}.json")
+
+
+def start_worker(port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "BRIEFING_SCHEDULER": str(port == settings.worker_base_port).lower(),
+        "BRIEFING_SHARED_PATH": BRIEFING_SHARED_PATH,
+    }
+    return subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app:app",
+        "--host", "127.0.0.1",
+        "--port", str(port),
+        "--timeout-graceful-shutdown", str(settings.drain_timeout),
+    ], env=env)
+
+
+class RouterServer(uvicorn.Server):
+    """Stops worker restarts as soon as a shutdown signal arrives, before the drain."""
+
+    def __init__(self, config: uvicorn.Config, stopping: threading.Event):
+        super().__init__(config)
+        self.stopping = stopping
+
+    def handle_exit(self, sig, frame):
+        # Ctrl-C or a process-group kill also reaches the workers; don't respawn them
+        self.stopping.set()
+        super().handle_exit(sig, frame)
+
+
+def supervise(processes: dict[int, subprocess.Popen], stopping: threading.Event, lock: threading.Lock):
+    while not stopping.wait(1.0):
+        with lock:
+            if stopping.is_set():
+                return
+            for port, process in processes.items():
+                if process.poll() is not None:
+                    logger.warning(f"Worker on port {port} exited with {process.returncode}, restarting")
+                    processes[port] = start_worker(port)
+
+
+def stop_workers(processes: dict[int, subprocess.Popen], stopping: threading.Event, lock: threading.Lock):
+    # Under the lock no restart can slip in after the processes have been signalled
+    with lock:
+        stopping.set()
+        for process in processes.values():
+            if process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+    for port, process in processes.items():
+        try:
+            process.wait(timeout=settings.drain_timeout + 5)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Worker on port {port} did not drain in time, killing")
+            process.kill()
+
+
+def exit_on_signal(sig, frame):
+    raise SystemExit(128 + sig)
+
+
+def main():
+    if settings.workers <= 1:
+        uvicorn.run(
+            "app:app",
+            host=settings.host,
+            port=settings.port,
+            timeout_graceful_shutdown=settings.drain_timeout,
+        )
+        return
+
+    ports = [settings.worker_base_port + index for index in range(settings.workers)]
+    processes = {port: start_worker(port) for port in ports}
+    logger.info(f"Started {len(ports)} chat_backend workers on ports {ports}")
+
+    stopping = threading.Event()
+    lock = threading.Lock()
+    threading.Thread(target=supervise, args=(processes, stopping, lock), daemon=True).start()
+
+    # The router is imported in this process and reads its worker list from settings
+    settings.worker_ports = ",".join(str(port) for port in ports)
+    config = uvicorn.Config(
+        "server.router:app",
+        host=settings.host,
+        port=settings.port,
+        timeout_graceful_shutdown=settings.drain_timeout,
+    )
+    # uvicorn re-raises the shutdown signal once the router has drained; turn
+    # SIGTERM into SystemExit so the workers are still stopped below
+    signal.signal(signal.SIGTERM, exit_on_signal)
+    try:
+        RouterServer(config, stopping).run()
+    finally:
+        stop_workers(processes, stopping, lock)
+        if os.path.exists(BRIEFING_SHARED_PATH):
+            os.remove(BRIEFING_SHARED_PATH)
+        logger.info("All chat_backend workers stopped")
+
+
+if __name__ == "__main__":
+    main()
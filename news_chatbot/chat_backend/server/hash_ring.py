@@ -0,0 +1,40 @@
+import bisect
+import hashlib
+from typing import Iterator, List
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes.
+
+    Adding or removing a node only moves the keys that node owned, so most
+    sessions keep landing on the same worker.
+    """
+
+    def __init__(self, nodes: List[str], replicas: int = 100):
+        self.nodes = list(nodes)
+        points = sorted(
+            (_hash(f"{node}#{replica}"), node)
+            for node in self.nodes
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def get(self, key: str) -> str:
+        return next(self.iter_nodes(key))
+
+    def iter_nodes(self, key: str) -> Iterator[str]:
+        """Yield every node once, starting with the key's owner, in ring order."""
+        start = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        seen = set()
+        for offset in range(len(self._owners)):
+            node = self._owners[(start + offset) % len(self._owners)]
+            if node not in seen:
+                seen.add(node)
+                yield node
+                if len(seen) == len(self.nodes):
+                    return
@@ -0,0 +1,133 @@
+"""Front router for multi-worker chat_backend.
+
+Proxies every request to one of the worker processes started by serve.py.
+Requests that carry a session id (in the JSON body or the /api/session/ path)
+are consistent-hashed so all of a session's turns reach the worker that holds
+its history. Other requests are spread round-robin.
+"""
+import asyncio
+import itertools
+import json
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from loguru import logger
+from starlette.background import BackgroundTask
+
+from server.hash_ring import HashRing
+from utils.log import setup_logging
+from utils.settings import settings
+
+setup_logging()
+
+SESSION_PATH = re.compile(r"^api/session/([^/]+)")
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "host", "content-length"}
+
+workers = [f"http://127.0.0.1:{port.strip()}" for port in settings.worker_ports.split(",") if port.strip()]
+ring = HashRing(workers)
+round_robin = itertools.cycle(workers)
+client: Optional[httpx.AsyncClient] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client
+    client = httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=None))
+    logger.info(f"Router on {settings.host}:{settings.port} for {len(workers)} workers")
+    yield
+    await client.aclose()
+    logger.info("Router shut down")
+    await logger.complete()
+
+
+app = FastAPI(title="News Chatbot - Chat Backend Router", lifespan=lifespan)
+
+
+def session_id_for(path: str, body: bytes) -> Optional[str]:
+    match = SESSION_PATH.match(path)
+    if match:
+        return match.group(1)
+    if body and path.startswith("api/chat") and path != "api/chat/batch":
+        try:
+            session_id = json.loads(body).get("session_id")
+        except (ValueError, AttributeError):
+            return None
+        # Anything but a string is invalid; let the worker reject it with a 422
+        return session_id if isinstance(session_id, str) else None
+    return None
+
+
+def forward_headers(headers) -> dict:
+    return {key: value for key, value in headers.items() if key.lower() not in HOP_BY_HOP_HEADERS}
+
+
+async def send(worker: str, request: Request, path: str, body: bytes) -> httpx.Response:
+    upstream = client.build_request(
+        request.method,
+        f"{worker}/{path}",
+        params=request.query_params,
+        headers=forward_headers(request.headers),
+        content=body,
+    )
+    return await client.send(upstream, stream=True)
+
+
+@app.get("/api/health")
+async def health():
+    """Aggregate health of every worker."""
+    async def check(worker: str) -> dict:
+        try:
+            response = await client.get(f"{worker}/api/health", timeout=2.0)
+            return {"worker": worker, **response.json()}
+        except (httpx.HTTPError, ValueError) as e:
+            return {"worker": worker, "status": "unreachable", "error": str(e)}
+
+    reports = await asyncio.gather(*(check(worker) for worker in workers))
+    healthy = sum(report.get("status") == "healthy" for report in reports)
+    status = "healthy" if healthy == len(workers) else "degraded" if healthy else "unhealthy"
+    return JSONResponse(
+        {"status": status, "service": "chat_backend", "workers": reports},
+        status_code=200 if healthy else 503,
+    )
+
+
+@app.get("/api/sessions/export")
+async def export_sessions():
+    """Sessions live in every worker, so chain each worker's NDJSON export."""
+    async def generate() -> AsyncIterator[bytes]:
+        for worker in workers:
+            try:
+                async with client.stream("GET", f"{worker}/api/sessions/export") as response:
+                    async for chunk in response.aiter_raw():
+                        yield chunk
+            except httpx.HTTPError as e:
+                logger.error(f"Export from {worker} failed: {e}")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
+async def proxy(path: str, request: Request):
+    body = await request.body()
+    session_id = session_id_for(path, body)
+    candidates = ring.iter_nodes(session_id) if session_id else [next(round_robin)]
+
+    for worker in candidates:
+        try:
+            response = await send(worker, request, path, body)
+        except httpx.ConnectError:
+            # Worker is down or restarting; fall through to the next one on the ring
+            logger.warning(f"Worker {worker} unreachable for /{path}")
+            continue
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers=forward_headers(response.headers),
+            background=BackgroundTask(response.aclose),
+        )
+
+    return JSONResponse({"error": "No chat_backend worker available"}, status_code=503)
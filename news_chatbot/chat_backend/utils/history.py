@@ -0,0 +1,53 @@
+from typing import Dict, Iterator, List, Optional
+
+# Roles are stored as a single byte per message instead of a repeated string key
+ROLES = ("user", "assistant")
+ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+
+
+class SessionHistory:
+    """Append-only message history stored as parallel role codes and contents.
+
+    Messages are only expanded to ``{"role", "content"}`` dicts when they are
+    handed to the agent runner or serialized for the history API.
+    """
+
+    __slots__ = ("_roles", "_contents")
+
+    def __init__(self):
+        self._roles = bytearray()
+        self._contents: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def append(self, role: str, content: str):
+        self._roles.append(ROLE_CODES[role])
+        self._contents.append(content)
+
+    def message(self, index: int) -> Dict[str, str]:
+        return {"role": ROLES[self._roles[index]], "content": self._contents[index]}
+
+    def last_content(self, role: str) -> str:
+        """Content of the most recent message with `role`, or "" if there is none."""
+        index = self._roles.rfind(ROLE_CODES[role])
+        return self._contents[index] if index >= 0 else ""
+
+    def iter_messages(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """Yield messages in ``[start, stop)`` one at a time."""
+        end = len(self._contents) if stop is None else min(stop, len(self._contents))
+        for index in range(max(start, 0), end):
+            yield self.message(index)
+
+    def page(self, cursor: int = 0, limit: int = 50) -> Dict[str, object]:
+        """Return one page of messages plus the cursor for the next page."""
+        stop = cursor + limit
+        next_cursor = stop if stop < len(self._contents) else None
+        return {
+            "messages": list(self.iter_messages(cursor, stop)),
+            "next_cursor": next_cursor,
+        }
+
+    def to_input(self) -> List[Dict[str, str]]:
+        """Expand the full history into the input list expected by the agent runner."""
+        return list(self.iter_messages())
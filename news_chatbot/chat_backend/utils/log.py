@@ -0,0 +1,85 @@
+"""Logging setup for chat_backend.
+
+Messages go through a queued sink drained by a writer thread, so the event
+loop never waits on stderr. Each chat turn logs through a logger bound to the
+``trace_id`` that voice_backend sends in the ``X-Trace-Id`` header, so one
+turn can be followed across both services. Per-request logs are sampled per
+trace with ``trace_sampled``.
+"""
+import queue
+import random
+import sys
+import threading
+import uuid
+import zlib
+from typing import Optional
+
+from loguru import logger
+
+from utils.settings import settings
+
+TRACE_HEADER = "X-Trace-Id"
+
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
+    "<magenta>{extra[trace_id]}</magenta> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+
+
+class QueuedSink:
+    """Sink that hands formatted records to a writer thread.
+
+    Unlike loguru's ``enqueue=True`` nothing is pickled; the caller only pays
+    for formatting and a queue put.
+    """
+
+    def __init__(self, stream=sys.stderr):
+        self._stream = stream
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str):
+        self._queue.put(message)
+
+    def _drain(self):
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            self._stream.write(message)
+            if self._queue.empty():
+                self._stream.flush()
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join(timeout=2)
+
+
+def setup_logging():
+    logger.remove()
+    logger.configure(extra={"trace_id": "-"})
+    logger.add(
+        QueuedSink(sys.stderr),
+        level=settings.log_level,
+        format=LOG_FORMAT,
+        colorize=sys.stderr.isatty(),
+    )
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def sampled(rate: float) -> bool:
+    """True for roughly `rate` of calls; 1 always logs, 0 never does."""
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def trace_sampled(trace_id: Optional[str], rate: float) -> bool:
+    """Like ``sampled`` but decided by the trace ID, so every layer of both
+    services keeps or drops the same turns."""
+    if trace_id is None:
+        return sampled(rate)
+    return rate >= 1 or (rate > 0 and zlib.crc32(trace_id.encode()) / 2**32 < rate)
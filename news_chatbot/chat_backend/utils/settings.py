@@ -12,12 +12,33 @@ class ChatBackendSettings(BaseSettings):
     host: str = Field(default="0.0.0.0", alias="CHAT_BACKEND_HOST")
     port: int = Field(default=8000, alias="CHAT_BACKEND_PORT")
 
+    workers: int = Field(default=1, alias="CHAT_BACKEND_WORKERS")
+    worker_base_port: int = Field(default=8100, alias="CHAT_BACKEND_WORKER_BASE_PORT")
+    worker_ports: str = Field(default="", alias="CHAT_BACKEND_WORKER_PORTS")
+    drain_timeout: int = Field(default=30, alias="CHAT_BACKEND_DRAIN_TIMEOUT")
+
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4o", alias="OPENAI_MODEL")
 
+    fast_path_enabled: bool = Field(default=True, alias="FAST_PATH_ENABLED")
+    fast_model: str = Field(default="gpt-4o-mini", alias="FAST_MODEL")
+
     google_search_api_key: str = Field(default="", alias="GOOGLE_SEARCH_API_KEY")
     google_search_engine_id: str = Field(default="", alias="GOOGLE_SEARCH_ENGINE_ID")
 
+    log_level: str = Field(default="DEBUG", alias="LOG_LEVEL")
+    log_request_sample_rate: float = Field(default=1.0, alias="LOG_REQUEST_SAMPLE_RATE")
+
+    batch_concurrency: int = Field(default=4, alias="BATCH_CONCURRENCY")
+
+    briefings_enabled: bool = Field(default=False, alias="BRIEFINGS_ENABLED")
+    briefing_topics: str = Field(default="top-stories,tech,markets", alias="BRIEFING_TOPICS")
+    briefing_refresh_seconds: int = Field(default=900, alias="BRIEFING_REFRESH_SECONDS")
+    briefing_max_age_seconds: int = Field(default=1800, alias="BRIEFING_MAX_AGE_SECONDS")
+    # Set per worker by serve.py: only one worker refreshes, the rest read its file
+    briefing_scheduler: bool = Field(default=True, alias="BRIEFING_SCHEDULER")
+    briefing_shared_path: str = Field(default="", alias="BRIEFING_SHARED_PATH")
+
     model_config = SettingsConfigDict(
         env_file=str(dotenv_path) if dotenv_path.exists() else None,
         case_sensitive=False,
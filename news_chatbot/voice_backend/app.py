@@ -1,6 +1,6 @@
 import uuid
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Literal, Optional
 import aiohttp
 import uvicorn
 from fastapi import FastAPI, WebSocket, BackgroundTasks, Query
@@ -10,15 +10,28 @@ from loguru import logger
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 
 from utils.settings import settings
+from utils.log import setup_logging
 from bots.news_bot import run_bot
+from serializers.opus_codec import opus_available
+from services.speculation import speculation_report
+
+setup_logging()
 
 daily_rest_helper = None
 aiohttp_session = None
 session_prompts: dict[str, str] = {}
+session_codecs: dict[str, str] = {}
 
 
 class ConnectRequest(BaseModel):
     system_prompt: Optional[str] = None
+    codec: Optional[Literal["pcm", "opus"]] = None
+
+
+def negotiate_codec(requested: Optional[str]) -> str:
+    if requested == "opus" and settings.opus_enabled and opus_available():
+        return "opus"
+    return "pcm"
 
 
 @asynccontextmanager
@@ -43,6 +56,7 @@ async def lifespan(app: FastAPI):
     if aiohttp_session:
         await aiohttp_session.close()
     logger.info("Voice backend shutting down")
+    await logger.complete()
 
 
 app = FastAPI(
@@ -66,6 +80,7 @@ async def health_check():
         "service": "voice_backend",
         "transport": settings.transport_type,
         "tts_provider": settings.tts_provider,
+        "speculation": speculation_report() if settings.speculative_enabled else None,
     }
 
 
@@ -93,10 +108,13 @@ async def connect(request: ConnectRequest = None):
         }
 
     elif settings.transport_type == "websocket":
+        codec = negotiate_codec(request.codec if request else None)
+        session_codecs[session_id] = codec
         return {
             "transport": "websocket",
             "ws_url": f"ws://localhost:{settings.port}/ws?session_id={session_id}",
-            "session_id": session_id
+            "session_id": session_id,
+            "codec": codec
         }
 
     return {"error": f"Unknown transport type: {settings.transport_type}"}
@@ -148,14 +166,21 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str = Query(None)
         session_id = str(uuid.uuid4())
 
     system_prompt = session_prompts.pop(session_id, None)
-    logger.info(f"WebSocket connected, session: {session_id}, has_prompt: {system_prompt is not None}")
+    codec = session_codecs.pop(session_id, "pcm")
+    logger.info(f"WebSocket connected, session: {session_id}, has_prompt: {system_prompt is not None}, codec: {codec}")
 
-    from pipecat.serializers.protobuf import ProtobufFrameSerializer
     from pipecat.transports.websocket.fastapi import (
         FastAPIWebsocketParams,
         FastAPIWebsocketTransport,
     )
 
+    if codec == "opus":
+        from serializers.opus_serializer import OpusProtobufFrameSerializer
+        serializer = OpusProtobufFrameSerializer(bitrate=settings.opus_bitrate)
+    else:
+        from pipecat.serializers.protobuf import ProtobufFrameSerializer
+        serializer = ProtobufFrameSerializer()
+
     transport = FastAPIWebsocketTransport(
         websocket=websocket,
         params=FastAPIWebsocketParams(
@@ -163,7 +188,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str = Query(None)
             audio_out_enabled=True,
             add_wav_header=False,
             vad_analyzer=SileroVADAnalyzer(),
-            serializer=ProtobufFrameSerializer(),
+            serializer=serializer,
         ),
     )
 
@@ -0,0 +1,56 @@
+"""Logging cost per streamed text chunk.
+
+Compares the old eager f-string debug log on a synchronous sink with lazy,
+queued and sampled logging, at DEBUG and INFO levels. The sink writes to
+/dev/null, so the sync numbers are a lower bound; a real stderr pipe can
+block the event loop where the queued sink cannot.
+
+    uv run python -m benchmarks.logging_bench --chunks 20000
+"""
+import argparse
+import os
+import time
+
+from loguru import logger
+
+from utils.log import LOG_FORMAT, QueuedSink, sampled
+
+CHUNK = "The Federal Reserve held interest rates steady on Wednesday, "
+
+
+def eager(chunk: str, rate: float):
+    logger.debug(f"Text chunk: {chunk[:30]}...")
+
+
+def lazy(chunk: str, rate: float):
+    if rate and sampled(rate):
+        logger.opt(lazy=True).debug("Text chunk: {}...", lambda: chunk[:30])
+
+
+def measure(label: str, log_call, level: str, sink: str, rate: float, chunks: int):
+    logger.remove()
+    logger.configure(extra={"trace_id": "-"})
+    with open(os.devnull, "w") as stream:
+        options = {"enqueue": True} if sink == "enqueue" else {}
+        target = QueuedSink(stream) if sink == "queued" else stream
+        handler = logger.add(target, level=level, format=LOG_FORMAT, **options)
+        with logger.contextualize(trace_id="0123456789abcdef"):
+            started = time.perf_counter()
+            for _ in range(chunks):
+                log_call(CHUNK, rate)
+            elapsed = time.perf_counter() - started
+        logger.remove(handler)
+    print(f"{label:<42} {level:<6} {elapsed / chunks * 1e6:8.2f} us/chunk")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20000)
+    chunks = parser.parse_args().chunks
+
+    for level in ("DEBUG", "INFO"):
+        measure("eager f-string, sync sink", eager, level, "sync", 1.0, chunks)
+        measure("lazy, loguru enqueue=True, every chunk", lazy, level, "enqueue", 1.0, chunks)
+        measure("lazy, QueuedSink, every chunk", lazy, level, "queued", 1.0, chunks)
+        measure("lazy, QueuedSink, 1% sampled", lazy, level, "queued", 0.01, chunks)
+        measure("disabled (rate 0)", lazy, level, "queued", 0.0, chunks)
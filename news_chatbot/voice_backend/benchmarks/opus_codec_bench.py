@@ -0,0 +1,74 @@
+"""Opus vs raw PCM cost per call on the websocket transport.
+
+Encodes and decodes a synthetic voiced signal in the same chunk sizes the
+transport uses and reports CPU time against bandwidth saved.
+
+    uv run --extra opus python -m benchmarks.opus_codec_bench --call-seconds 300
+"""
+import argparse
+import math
+import random
+import time
+from array import array
+
+from serializers.opus_codec import OpusCodec, opus_available
+
+
+def synthetic_speech(sample_rate: int, seconds: float) -> bytes:
+    """Harmonic tone with syllable-rate amplitude modulation and a little noise."""
+    rng = random.Random(0)
+    samples = array("h")
+    for n in range(int(sample_rate * seconds)):
+        t = n / sample_rate
+        pitch = 140 + 30 * math.sin(2 * math.pi * 0.5 * t)
+        voiced = sum(math.sin(2 * math.pi * pitch * k * t) / k for k in range(1, 6))
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 4 * t)
+        value = 6000 * envelope * voiced + rng.gauss(0, 200)
+        samples.append(max(-32768, min(32767, int(value))))
+    return samples.tobytes()
+
+
+def run(sample_rate: int, chunk_ms: int, call_seconds: int, bitrate: int):
+    pcm = synthetic_speech(sample_rate, 10)
+    chunk_bytes = sample_rate * chunk_ms // 1000 * 2
+    chunks = [pcm[i:i + chunk_bytes] for i in range(0, len(pcm), chunk_bytes)]
+
+    encoder_side = OpusCodec(bitrate=bitrate)
+    decoder_side = OpusCodec(bitrate=bitrate)
+    payload_bytes = 0
+
+    started = time.process_time()
+    for chunk in chunks:
+        payload = encoder_side.encode(chunk, sample_rate, 1)
+        payload_bytes += len(payload)
+        if payload:
+            decoder_side.decode(payload, sample_rate, 1)
+    cpu_seconds = time.process_time() - started
+
+    audio_seconds = len(pcm) / (sample_rate * 2)
+    pcm_kbps = sample_rate * 16 / 1000
+    opus_kbps = payload_bytes * 8 / audio_seconds / 1000
+    cpu_ms_per_audio_second = cpu_seconds * 1000 / audio_seconds
+    saved_mb = (pcm_kbps - opus_kbps) * call_seconds / 8 / 1000
+
+    print(
+        f"{sample_rate:>6} Hz  {chunk_ms:>3} ms chunks  "
+        f"pcm {pcm_kbps:6.1f} kbps  opus {opus_kbps:5.1f} kbps  "
+        f"cpu {cpu_ms_per_audio_second:5.2f} ms/s ({cpu_ms_per_audio_second / 10:.2f}% of a core)  "
+        f"saves {saved_mb:5.2f} MB for {cpu_seconds / audio_seconds * call_seconds:5.2f} cpu-s "
+        f"per {call_seconds}s call direction"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--call-seconds", type=int, default=300)
+    parser.add_argument("--bitrate", type=int, default=24000)
+    args = parser.parse_args()
+
+    if not opus_available():
+        raise SystemExit("opuslib/libopus not installed; install the 'opus' extra and libopus0")
+
+    # Inbound mic audio at 16 kHz and outbound TTS audio at 24 kHz
+    for rate, chunk in ((16000, 20), (16000, 10), (24000, 40)):
+        run(rate, chunk, args.call_seconds, args.bitrate)
@@ -0,0 +1,58 @@
+"""NewsSpeechNormalizer vs pipecat's MarkdownTextFilter on streamed news output.
+
+Replays a typical agent response sentence by sentence, the way the TTS text
+aggregator hands it to text filters, and reports time per sentence.
+
+    uv run python -m benchmarks.speech_normalizer_bench --rounds 2000
+"""
+import argparse
+import asyncio
+import time
+
+from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
+
+from services.speech_normalizer import NewsSpeechNormalizer
+
+# One agent response, already split the way the TTS sentence aggregator emits it
+SENTENCES = [
+    "Here are today's top stories. ",
+    "**Markets:** The S&P 500 rose 1.2% to 5,123.45 on Jan. 5, 2024, while the Nasdaq gained 0.8%. ",
+    "Apple reported $89.5 billion in Q3 revenue, up 3% vs. last year, according to https://www.reuters.com/markets. ",
+    "In Washington, Sen. Maria Lopez said the vote on the $1.2 trillion package is set for 3:30 p.m. on March 21st. ",
+    "Oil prices slipped to $75.20 a barrel after OPEC said output would rise by 400,000 barrels a day. ",
+    "In Europe, the E.U. agreed new climate targets for 2030, and the U.K. inflation rate eased to 3.4 percent. ",
+    "Finally, the 2024 Olympic torch relay reached its 42nd stop, drawing crowds of about 12,000 people. ",
+]
+
+
+async def time_filter(text_filter, chunks: list[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for chunk in chunks:
+            await text_filter.reset_interruption()
+            await text_filter.filter(chunk)
+    return (time.perf_counter() - started) / (rounds * len(chunks))
+
+
+async def main(rounds: int):
+    chunks = SENTENCES
+    markdown_filter = MarkdownTextFilter()
+    normalizer = NewsSpeechNormalizer()
+
+    markdown_seconds = await time_filter(markdown_filter, chunks, rounds)
+    normalizer_seconds = await time_filter(normalizer, chunks, rounds)
+
+    print(f"{len(chunks)} sentences x {rounds} rounds")
+    print(f"MarkdownTextFilter    {markdown_seconds * 1e6:8.1f} us/sentence")
+    print(f"NewsSpeechNormalizer  {normalizer_seconds * 1e6:8.1f} us/sentence "
+          f"({markdown_seconds / normalizer_seconds:.1f}x)")
+    print()
+    for chunk in chunks[1:4]:
+        print(f"markdown:   {await markdown_filter.filter(chunk)}")
+        print(f"normalizer: {await normalizer.filter(chunk)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    asyncio.run(main(parser.parse_args().rounds))
@@ -18,6 +18,7 @@ from pipecat.services.deepgram.stt import DeepgramSTTService
 from pipecat.transports.base_transport import BaseTransport
 
 from services.news_llm import NewsAgentLLMService
+from services.speculation import SpeculativeTranscriptTap
 from services.tts_factory import create_tts_service
 from utils.settings import settings
 
@@ -39,9 +40,12 @@ async def run_bot(transport: BaseTransport, session_id: str = "default", system_
 
     rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
 
+    processors = [transport.input(), stt]
+    if settings.speculative_enabled:
+        processors.append(SpeculativeTranscriptTap(llm))
+
     pipeline = Pipeline([
-        transport.input(),
-        stt,
+        *processors,
         context_aggregator.user(),
         rtvi,
         llm,
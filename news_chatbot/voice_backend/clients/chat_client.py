@@ -2,6 +2,7 @@ import json
 import httpx
 from typing import AsyncIterator, Optional, Dict, Any
 from loguru import logger
+from utils.log import TRACE_HEADER, trace_sampled
 from utils.settings import settings
 
 
@@ -26,12 +27,19 @@ class ChatClient:
             self.client = None
             logger.debug("HTTP client closed")
 
-    async def stream_response(self, message: str) -> AsyncIterator[Dict[str, Any]]:
-        """Stream response from chat backend. Server manages session history."""
+    async def stream_response(
+        self, message: str, trace_id: Optional[str] = None, speculative: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream response from chat backend. Server manages session history.
+
+        Speculative responses are not added to the history until `commit_turn`.
+        """
         if not self.client:
             await self.connect()
 
-        logger.info(f"Streaming request: {message[:50]}...")
+        log_request = trace_sampled(trace_id, settings.log_request_sample_rate)
+        if log_request:
+            logger.opt(lazy=True).info("Streaming request: {}...", lambda: message[:50])
 
         async with self.client.stream(
             "POST",
@@ -40,8 +48,10 @@ class ChatClient:
                 "message": message,
                 "session_id": self.session_id,
                 "history": [],
-                "system_prompt": self.system_prompt
+                "system_prompt": self.system_prompt,
+                "speculative": speculative
             },
+            headers={TRACE_HEADER: trace_id} if trace_id else None,
             timeout=settings.chat_timeout
         ) as response:
             response.raise_for_status()
@@ -54,7 +64,7 @@ class ChatClient:
                     data = json.loads(line[6:])
 
                     if data.get("error"):
-                        logger.error(f"Stream error from backend: {data['error']}")
+                        logger.error("Stream error from backend: {}", data["error"])
                         raise Exception(data["error"])
 
                     event_type = data.get("type", "text")
@@ -65,13 +75,26 @@ class ChatClient:
                             yield {"type": "text", "content": content}
 
                     elif event_type == "done":
-                        logger.info(f"Stream completed for session {self.session_id}")
+                        if log_request:
+                            logger.info("Stream completed for session {}", self.session_id)
                         break
 
                 except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse SSE data: {line}, error: {e}")
+                    logger.warning("Failed to parse SSE data: {}, error: {}", line, e)
                     continue
 
+    async def commit_turn(self, message: str = "", response: str = "", trace_id: Optional[str] = None):
+        """Add a speculative turn's user message and/or response to the server-side history."""
+        if not self.client:
+            await self.connect()
+
+        result = await self.client.post(
+            f"{self.base_url}/api/session/{self.session_id}/commit",
+            json={"message": message, "response": response},
+            headers={TRACE_HEADER: trace_id} if trace_id else None,
+        )
+        result.raise_for_status()
+
     async def __aenter__(self):
         await self.connect()
         return self
@@ -0,0 +1,132 @@
+"""Opus packetizer for websocket audio.
+
+Raw 16-bit PCM is split into 20 ms Opus frames. One websocket audio frame
+carries any number of packets, each prefixed with its length as a 2-byte
+big-endian integer.
+
+The encoder hands libopus pointers into the caller's PCM, so whole frames are
+never copied on the way in. PCM that does not fill a 20 ms frame is copied
+into a one-frame buffer and completed on the next call. Each packet is
+written once into a reused output buffer and then appended to the payload.
+"""
+import ctypes
+from typing import Optional
+
+try:
+    import opuslib
+    from opuslib.api.encoder import libopus_encode
+except Exception:  # opuslib raises a plain Exception when libopus itself is missing
+    opuslib = None
+
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+FRAME_MS = 20
+# Longest packet a peer may send is 120 ms
+MAX_FRAME_MS = 120
+# libopus' recommended upper bound for one packet
+MAX_PACKET_BYTES = 4000
+
+
+def opus_available() -> bool:
+    return opuslib is not None
+
+
+class OpusCodec:
+    """Per-session Opus encoder/decoder pair, created lazily per audio format."""
+
+    def __init__(self, bitrate: int = 24000, complexity: int = 5):
+        self.bitrate = bitrate
+        self.complexity = complexity
+        self._encoder = None
+        self._encoder_format: Optional[tuple[int, int]] = None
+        self._decoder = None
+        self._decoder_format: Optional[tuple[int, int]] = None
+        self._pending = bytearray()
+        self._pending_len = 0
+        self._packet = None
+
+    def reset(self):
+        """Drop PCM held back from an unfinished frame."""
+        self._pending_len = 0
+
+    @staticmethod
+    def supports(sample_rate: int) -> bool:
+        return sample_rate in OPUS_SAMPLE_RATES
+
+    def _get_encoder(self, sample_rate: int, num_channels: int):
+        if self._encoder_format != (sample_rate, num_channels):
+            self._encoder = opuslib.Encoder(sample_rate, num_channels, "voip")
+            self._encoder.bitrate = self.bitrate
+            self._encoder.complexity = self.complexity
+            self._encoder_format = (sample_rate, num_channels)
+            self._pending = bytearray(sample_rate * FRAME_MS // 1000 * num_channels * 2)
+            self._pending_len = 0
+            self._packet = ctypes.create_string_buffer(MAX_PACKET_BYTES)
+        return self._encoder
+
+    def _get_decoder(self, sample_rate: int, num_channels: int):
+        if self._decoder_format != (sample_rate, num_channels):
+            self._decoder = opuslib.Decoder(sample_rate, num_channels)
+            self._decoder_format = (sample_rate, num_channels)
+        return self._decoder
+
+    def _encode_frame(self, encoder, address: int, frame_samples: int, packets: bytearray):
+        length = libopus_encode(
+            encoder.encoder_state,
+            ctypes.cast(address, opuslib.api.c_int16_pointer),
+            frame_samples,
+            self._packet,
+            MAX_PACKET_BYTES,
+        )
+        if length < 0:
+            raise opuslib.OpusError(f"Opus encoder returned {length}")
+        packets += length.to_bytes(2, "big")
+        packets += memoryview(self._packet)[:length]
+
+    def encode(self, pcm: bytes, sample_rate: int, num_channels: int) -> bytes:
+        """Encode PCM into length-prefixed Opus packets.
+
+        Returns an empty payload when less than one 20 ms frame is available.
+        """
+        encoder = self._get_encoder(sample_rate, num_channels)
+        frame_samples = sample_rate * FRAME_MS // 1000
+        frame_bytes = len(self._pending)
+        if not isinstance(pcm, bytes):
+            pcm = bytes(pcm)
+        view = memoryview(pcm)
+        packets = bytearray()
+
+        # Complete the frame left over from the previous call first
+        start = 0
+        if self._pending_len:
+            start = min(frame_bytes - self._pending_len, len(pcm))
+            self._pending[self._pending_len:self._pending_len + start] = view[:start]
+            self._pending_len += start
+            if self._pending_len < frame_bytes:
+                return b""
+            pending_address = ctypes.addressof((ctypes.c_char * frame_bytes).from_buffer(self._pending))
+            self._encode_frame(encoder, pending_address, frame_samples, packets)
+            self._pending_len = 0
+
+        # Whole frames are read by libopus in place; `pcm` stays alive for the loop
+        base = ctypes.cast(pcm, ctypes.c_void_p).value
+        usable = start + (len(pcm) - start) // frame_bytes * frame_bytes
+        for offset in range(start, usable, frame_bytes):
+            self._encode_frame(encoder, base + offset, frame_samples, packets)
+
+        self._pending_len = len(pcm) - usable
+        self._pending[:self._pending_len] = view[usable:]
+        return bytes(packets)
+
+    def decode(self, payload: bytes, sample_rate: int, num_channels: int) -> bytes:
+        """Decode length-prefixed Opus packets back into 16-bit PCM."""
+        decoder = self._get_decoder(sample_rate, num_channels)
+        max_samples = sample_rate * MAX_FRAME_MS // 1000
+        view = memoryview(payload)
+        pcm = bytearray()
+        offset = 0
+        while offset + 2 <= len(view):
+            length = int.from_bytes(view[offset:offset + 2], "big")
+            offset += 2
+            pcm += decoder.decode(view[offset:offset + length].tobytes(), max_samples)
+            offset += length
+        return bytes(pcm)
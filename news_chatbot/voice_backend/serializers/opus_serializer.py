@@ -0,0 +1,60 @@
+import time
+
+from loguru import logger
+from pipecat.frames.frames import Frame, InputAudioRawFrame, InterruptionFrame, OutputAudioRawFrame
+from pipecat.serializers.protobuf import ProtobufFrameSerializer
+from pipecat.transports.base_output import BOT_VAD_STOP_SECS
+
+from serializers.opus_codec import OpusCodec
+
+
+class OpusProtobufFrameSerializer(ProtobufFrameSerializer):
+    """Protobuf serializer whose audio frames carry Opus packets instead of raw PCM.
+
+    Non-audio frames are serialized exactly like ProtobufFrameSerializer. One
+    instance is created per websocket session so the Opus state is shared by
+    every frame of that call.
+
+    PCM left over from an unfinished 20 ms frame is dropped when the user
+    interrupts, and when audio stops for longer than pipecat's bot-stopped
+    threshold (the output transport drops its own leftover audio at that
+    point too), so the tail of one reply never starts the next.
+    """
+
+    def __init__(self, bitrate: int = 24000):
+        super().__init__()
+        self.codec = OpusCodec(bitrate=bitrate)
+        self._last_audio_at = 0.0
+
+    async def serialize(self, frame: Frame) -> str | bytes | None:
+        if isinstance(frame, InterruptionFrame):
+            self.codec.reset()
+        elif type(frame) is OutputAudioRawFrame and self.codec.supports(frame.sample_rate):
+            now = time.monotonic()
+            if now - self._last_audio_at > BOT_VAD_STOP_SECS:
+                self.codec.reset()
+            self._last_audio_at = now
+            packets = self.codec.encode(frame.audio, frame.sample_rate, frame.num_channels)
+            if not packets:
+                return None
+            frame = OutputAudioRawFrame(
+                audio=packets,
+                sample_rate=frame.sample_rate,
+                num_channels=frame.num_channels,
+            )
+        return await super().serialize(frame)
+
+    async def deserialize(self, data: str | bytes) -> Frame | None:
+        frame = await super().deserialize(data)
+        if isinstance(frame, InputAudioRawFrame) and self.codec.supports(frame.sample_rate):
+            try:
+                pcm = self.codec.decode(frame.audio, frame.sample_rate, frame.num_channels)
+            except Exception as e:
+                logger.warning(f"Dropping undecodable Opus audio frame: {e}")
+                return None
+            return InputAudioRawFrame(
+                audio=pcm,
+                sample_rate=frame.sample_rate,
+                num_channels=frame.num_channels,
+            )
+        return frame
@@ -3,6 +3,7 @@
 Custom LLM service that connects to the chat_backend via HTTP SSE.
 Based on the pattern from InnerDialogue's HealthcareAgent_LLMService.
 """
+import time
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
@@ -20,6 +21,15 @@ from pipecat.services.llm_service import LLMService
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContextFrame
 
 from clients.chat_client import ChatClient
+from services.speculation import (
+    Speculation,
+    normalize_transcript,
+    speculation_report,
+    speculation_stats,
+    transcripts_match,
+)
+from utils.log import new_trace_id, sampled, trace_sampled
+from utils.settings import settings
 
 
 class NewsAgentLLMService(LLMService):
@@ -27,33 +37,107 @@ class NewsAgentLLMService(LLMService):
     def __init__(self, session_id: str, system_prompt: str = None, **kwargs):
         super().__init__(**kwargs)
         self.client = ChatClient(session_id, system_prompt)
+        # Number of turns handed to chat_backend; SpeculativeTranscriptTap resets on change
+        self.turns = 0
+        self._speculation: Optional[Speculation] = None
         logger.info(f"NewsAgentLLMService initialized, session: {session_id}, has_prompt: {system_prompt is not None}")
 
+    async def speculate(self, text: str):
+        """Start a speculative chat stream for an interim transcript."""
+        current = self._speculation
+        if current and normalize_transcript(current.text) == normalize_transcript(text):
+            return
+        if current:
+            speculation_stats["restarted"] += 1
+            await self._cancel_speculation()
+
+        speculation = Speculation(text, new_trace_id())
+        speculation.task = self.create_task(speculation.run(self.client))
+        self._speculation = speculation
+        speculation_stats["started"] += 1
+        logger.debug("Speculating on interim transcript: {}", text)
+
+    async def _cancel_speculation(self):
+        speculation, self._speculation = self._speculation, None
+        if speculation and speculation.task and not speculation.task.done():
+            await self.cancel_task(speculation.task)
+
+    async def _take_speculation(self, user_message: str) -> Optional[Speculation]:
+        """Return the pending speculation if it answers `user_message`, else cancel it."""
+        speculation = self._speculation
+        if speculation is None:
+            return None
+
+        if speculation.error is None and transcripts_match(speculation.text, user_message):
+            self._speculation = None
+            speculation_stats["committed"] += 1
+            speculation_stats["lead_ms_total"] += (time.monotonic() - speculation.started_at) * 1000
+            return speculation
+
+        speculation_stats["failed" if speculation.error else "mismatched"] += 1
+        await self._cancel_speculation()
+        return None
+
     async def _process_context(self, messages: List[Dict[str, Any]]):
         """Process messages and stream response from chat backend."""
+        self.turns += 1
+
+        user_message = ""
+        for msg in reversed(messages):
+            if msg.get("role") == "user":
+                user_message = msg.get("content", "")
+                break
+
+        # A committed speculation was already streamed under its own trace ID;
+        # keep it for the whole turn so both services log it under one ID
+        speculation = None
+        if settings.speculative_enabled and user_message:
+            speculation = await self._take_speculation(user_message)
+        trace_id = speculation.trace_id if speculation else new_trace_id()
+
+        with logger.contextualize(trace_id=trace_id):
+            await self._stream_turn(messages, user_message, speculation, trace_id)
+
+    async def _stream_turn(
+        self,
+        messages: List[Dict[str, Any]],
+        user_message: str,
+        speculation: Optional[Speculation],
+        trace_id: str,
+    ):
         try:
-            logger.info(f"Processing {len(messages)} messages")
-
-            user_message = ""
-            for msg in reversed(messages):
-                if msg.get("role") == "user":
-                    user_message = msg.get("content", "")
-                    break
+            log_request = trace_sampled(trace_id, settings.log_request_sample_rate)
+            if log_request:
+                logger.info("Processing {} messages", len(messages))
 
             if not user_message:
                 logger.warning("No user message found")
                 return
 
-            logger.info(f"User message: {user_message[:50]}...")
-
-            async for event in self.client.stream_response(user_message):
-                if event.get("type") == "text":
-                    chunk = event.get("content", "")
-                    if chunk:
-                        logger.debug(f"Text chunk: {chunk[:30]}...")
-                        await self.push_frame(LLMTextFrame(text=chunk))
-
-            logger.info("Response stream completed")
+            if log_request:
+                logger.opt(lazy=True).info("User message: {}...", lambda: user_message[:50])
+
+            chunk_rate = settings.log_chunk_sample_rate
+            if speculation:
+                logger.info("Committing speculative run ({})", speculation_report())
+                # Store the user turn before speaking, so an interruption keeps it like a normal turn
+                await self.client.commit_turn(message=user_message, trace_id=trace_id)
+                async for chunk in speculation.chunks():
+                    if chunk_rate and sampled(chunk_rate):
+                        logger.opt(lazy=True).debug("Text chunk: {}...", lambda: chunk[:30])
+                    await self.push_frame(LLMTextFrame(text=chunk))
+                await self.client.commit_turn(response="".join(speculation.response), trace_id=trace_id)
+            else:
+                async for event in self.client.stream_response(user_message, trace_id):
+                    if event.get("type") == "text":
+                        chunk = event.get("content", "")
+                        if chunk:
+                            if chunk_rate and sampled(chunk_rate):
+                                logger.opt(lazy=True).debug("Text chunk: {}...", lambda: chunk[:30])
+                            await self.push_frame(LLMTextFrame(text=chunk))
+
+            if log_request:
+                logger.info("Response stream completed")
 
         except Exception as e:
             logger.error(f"Error processing context: {e}", exc_info=True)
@@ -68,14 +152,14 @@ class NewsAgentLLMService(LLMService):
         if isinstance(frame, OpenAILLMContextFrame):
             context = frame.context
             messages = context.get_messages()
-            logger.info(f"OpenAILLMContextFrame with {len(messages)} messages")
+            logger.debug("OpenAILLMContextFrame with {} messages", len(messages))
         elif isinstance(frame, LLMContextFrame):
             context = frame.context
             messages = context.get_messages()
-            logger.info(f"LLMContextFrame with {len(messages)} messages")
+            logger.debug("LLMContextFrame with {} messages", len(messages))
         elif isinstance(frame, LLMMessagesFrame):
             messages = frame.messages
-            logger.info(f"LLMMessagesFrame with {len(messages)} messages")
+            logger.debug("LLMMessagesFrame with {} messages", len(messages))
         else:
             await self.push_frame(frame, direction)
 
@@ -94,6 +178,9 @@ class NewsAgentLLMService(LLMService):
     async def cleanup(self):
         logger.info("Cleaning up NewsAgentLLMService")
         try:
+            await self._cancel_speculation()
+            if settings.speculative_enabled:
+                logger.info("Speculation stats: {}", speculation_report())
             await self.client.disconnect()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
@@ -0,0 +1,135 @@
+"""Speculative chat_backend runs on interim transcripts.
+
+SpeculativeTranscriptTap sits right after STT and watches interim and final
+transcription frames. Once the transcript has stayed the same for a few
+interim updates, it asks NewsAgentLLMService to start a speculative chat
+stream. The stream's chunks are buffered, not pushed. When the aggregated
+final transcript reaches the LLM service, the speculation is committed only
+if the normalized texts are equal. Any difference, including extra trailing
+words, cancels it (counted as waste) and the turn runs normally.
+"""
+import asyncio
+import re
+import time
+from typing import AsyncIterator, List, Optional
+
+from loguru import logger
+from pipecat.frames.frames import Frame, InterimTranscriptionFrame, TranscriptionFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from utils.settings import settings
+
+# Aggregated across all sessions of this process; reported by /health
+speculation_stats = {
+    "started": 0,
+    "committed": 0,
+    "restarted": 0,
+    "mismatched": 0,
+    "failed": 0,
+    "lead_ms_total": 0.0,
+}
+
+
+def speculation_report() -> dict:
+    started = speculation_stats["started"]
+    committed = speculation_stats["committed"]
+    wasted = started - committed
+    return {
+        **{key: value for key, value in speculation_stats.items() if key != "lead_ms_total"},
+        "commit_rate": round(committed / started, 3) if started else None,
+        "waste_rate": round(wasted / started, 3) if started else None,
+        "avg_lead_ms": round(speculation_stats["lead_ms_total"] / committed, 1) if committed else None,
+    }
+
+
+def normalize_transcript(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s']", " ", text.lower()).split())
+
+
+def transcripts_match(speculated: str, final: str) -> bool:
+    """True only if both transcripts normalize to the same text.
+
+    Substituted words ("in germany" vs "in japan") and appended ones ("tell me
+    about" vs "tell me about apple") both change the question.
+    """
+    return normalize_transcript(speculated) == normalize_transcript(final)
+
+
+class Speculation:
+    """One speculative chat stream whose chunks are buffered until commit."""
+
+    def __init__(self, text: str, trace_id: str):
+        self.text = text
+        self.trace_id = trace_id
+        self.started_at = time.monotonic()
+        self.task: Optional[asyncio.Task] = None
+        self.response: List[str] = []
+        self.error: Optional[Exception] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def run(self, client):
+        try:
+            with logger.contextualize(trace_id=self.trace_id):
+                async for event in client.stream_response(self.text, self.trace_id, speculative=True):
+                    if event.get("type") == "text" and event.get("content"):
+                        self._queue.put_nowait(event["content"])
+        except Exception as e:
+            self.error = e
+        finally:
+            self._queue.put_nowait(None)
+
+    async def chunks(self) -> AsyncIterator[str]:
+        """Yield buffered chunks, then live ones, until the stream ends."""
+        while True:
+            chunk = await self._queue.get()
+            if chunk is None:
+                if self.error:
+                    raise self.error
+                return
+            self.response.append(chunk)
+            yield chunk
+
+
+class SpeculativeTranscriptTap(FrameProcessor):
+    """Passes every frame through and starts speculation on stable transcripts."""
+
+    def __init__(self, llm, **kwargs):
+        super().__init__(**kwargs)
+        self._llm = llm
+        self._finals: List[str] = []
+        self._last_candidate = ""
+        self._repeats = 0
+        self._seen_turns = 0
+
+    def _candidate(self, interim: str = "") -> str:
+        return " ".join(part for part in [*self._finals, interim] if part)
+
+    async def _maybe_speculate(self, candidate: str, stable: bool):
+        normalized = normalize_transcript(candidate)
+        if normalized == self._last_candidate:
+            self._repeats += 1
+        else:
+            self._last_candidate = normalized
+            self._repeats = 1
+
+        stable = stable or self._repeats >= settings.speculative_stable_interims
+        if stable and len(normalized.split()) >= settings.speculative_min_words:
+            await self._llm.speculate(candidate)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        # A new turn has been handed to the LLM since we last looked
+        if self._llm.turns != self._seen_turns:
+            self._seen_turns = self._llm.turns
+            self._finals.clear()
+            self._last_candidate = ""
+            self._repeats = 0
+
+        if isinstance(frame, TranscriptionFrame) and frame.text.strip():
+            self._finals.append(frame.text.strip())
+            await self._maybe_speculate(self._candidate(), stable=True)
+        elif isinstance(frame, InterimTranscriptionFrame) and frame.text.strip():
+            await self._maybe_speculate(self._candidate(frame.text.strip()), stable=False)
+
+        await self.push_frame(frame, direction)
@@ -0,0 +1,312 @@
+"""Speech normalizer for news output.
+
+Replaces pipecat's MarkdownTextFilter in the TTS chain. Each aggregated
+sentence is rewritten by a single regex pass whose alternatives cover
+markdown, links and URLs (reduced to their host name), currencies,
+percentages, dates, decades, times, ordinals, fractions and slashed pairs,
+model numbers, negative and plain numbers and common news abbreviations.
+The only state carried between calls is whether an unterminated code fence
+is still open, so earlier text is never scanned again.
+"""
+import re
+from typing import Any, Mapping, Optional
+
+from pipecat.utils.text.base_text_filter import BaseTextFilter
+
+ONES = [
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+    "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen",
+    "eighteen", "nineteen",
+]
+TENS = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+SCALES = [(10**12, "trillion"), (10**9, "billion"), (10**6, "million"), (10**3, "thousand")]
+ORDINAL_WORDS = {
+    "one": "first", "two": "second", "three": "third", "five": "fifth",
+    "eight": "eighth", "nine": "ninth", "twelve": "twelfth",
+}
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+]
+MONTH_ABBREVIATIONS = {
+    "Jan": "January", "Feb": "February", "Mar": "March", "Apr": "April", "Jun": "June",
+    "Jul": "July", "Aug": "August", "Sep": "September", "Sept": "September",
+    "Oct": "October", "Nov": "November", "Dec": "December",
+}
+
+CURRENCIES = {"$": ("dollar", "dollars", "cent", "cents"), "£": ("pound", "pounds", "penny", "pence"),
+              "€": ("euro", "euros", "cent", "cents")}
+MAGNITUDES = {
+    "k": "thousand", "m": "million", "mn": "million", "b": "billion", "bn": "billion",
+    "t": "trillion", "tn": "trillion",
+}
+
+# Abbreviations that end in a period and are spoken as a full word
+ABBREVIATIONS = {
+    "Sen.": "Senator", "Rep.": "Representative", "Gov.": "Governor", "Pres.": "President",
+    "Gen.": "General", "Lt.": "Lieutenant", "Sgt.": "Sergeant", "Prof.": "Professor",
+    "Dr.": "Doctor", "Mr.": "Mister", "Mrs.": "Missus", "vs.": "versus", "approx.": "approximately",
+    "e.g.": "for example", "i.e.": "that is", "etc.": "et cetera.", "U.S.": "U S", "U.K.": "U K",
+    "E.U.": "E U", "U.N.": "U N",
+}
+
+# Three digit numbers spoken digit by digit wherever they appear
+SPOKEN_AS_DIGITS = {"911", "999", "112", "311", "411"}
+
+# Capitalized words that introduce a quantity, not a model name ("About 125 ...")
+QUANTITY_LEAD_WORDS = {
+    "a", "about", "after", "all", "almost", "and", "another", "around", "at", "before", "but",
+    "by", "for", "from", "in", "just", "last", "more", "nearly", "of", "on", "only", "over",
+    "roughly", "since", "some", "than", "the", "to", "under", "up", "with",
+}
+
+NUMBER = r"(?:\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+MONTH_NAMES = "|".join(MONTHS + [rf"{abbr}\." for abbr in MONTH_ABBREVIATIONS])
+
+TOKEN_PATTERN = re.compile(
+    "|".join([
+        r"(?P<code_block>```.*?```)",
+        r"(?P<code_open>```.*)",
+        r"(?P<link>\[(?P<link_text>[^\]\n]+)\]\([^)\s]+\))",
+        r"(?P<url>(?:https?://|(?=www\.))(?:www\.)?(?P<url_host>[\w-]+(?:\.[\w-]+)+)(?:[^\s)\]]*[^\s.,;:!?)\]])?)",
+        r"(?P<html><[^<>\n]+>)",
+        rf"(?P<currency>(?P<symbol>[$£€])\s?(?P<amount>{NUMBER})"
+        rf"(?:\s?(?P<magnitude>thousand|million|billion|trillion|[kKmMbBtT]n?)\b)?)",
+        r"(?P<minus>(?<![\w.-])[-\u2212](?=[$£€]?\d))",
+        rf"(?P<percent>(?<![\w.])(?P<percent_value>{NUMBER})\s?(?:%|percent\b))",
+        r"(?P<iso_date>\b(?P<iso_year>\d{4})-(?P<iso_month>0[1-9]|1[0-2])-(?P<iso_day>[0-2]\d|3[01])\b)",
+        rf"(?P<date>\b(?P<month>{MONTH_NAMES})\s+(?P<day>[1-9]|[12]\d|3[01])(?:st|nd|rd|th)?\b"
+        r"(?:,?\s+(?P<year>\d{4})\b)?)",
+        r"(?P<time>\b(?P<hour>1[0-2]|0?[1-9]):(?P<minute>[0-5]\d)"
+        # The dot after "p.m." is kept when it also ends the sentence
+        r"(?:\s?(?P<meridiem>[ap])\.?m\b(?:\.(?=\s+[a-z]))?)?)",
+        r"(?P<decade>(?<![\w.])(?P<decade_year>\d{3}0)['\u2019]?s\b"
+        r"|(?<![\w.])['\u2019](?P<decade_short>\d0)s\b)",
+        r"(?P<model>(?<!&)\b(?P<model_word>[A-Z][A-Za-z]*) (?P<model_value>\d{3})(?!\w|[.,]\d))",
+        r"(?P<slash>(?<![\w./])(?P<slash_left>\d{1,2})/(?P<slash_right>\d{1,2})(?![\w/]|\.\d))",
+        r"(?P<ordinal>\b(?P<ordinal_value>\d+)(?:st|nd|rd|th)\b)",
+        r"(?P<quarter>\bQ(?P<quarter_value>[1-4])\b)",
+        r"(?P<number_sign>\bNo\.(?=\s*\d))",
+        "(?P<abbreviation>" + "|".join(
+            (r"(?<![\w.])" if abbr[0].isupper() and abbr[1] == "." else r"\b") + re.escape(abbr)
+            for abbr in sorted(ABBREVIATIONS, key=len, reverse=True)
+        ) + ")",
+        rf"(?P<number>(?<![\w.]){NUMBER}(?!\w|\.\d))",
+        r"(?P<heading>^[ \t]*#{1,6}[ \t]*)",
+        r"(?P<rule>^[ \t]*[-*_]{3,}[ \t]*$)",
+        r"(?P<bullet>^[ \t]*(?:[-*+]|>)[ \t]+)",
+        r"(?P<markup>\*+|~~|`|(?<!\w)_{1,2}|_{1,2}(?!\w))",
+        r"(?P<pipe>\|)",
+    ]),
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def number_to_words(n: int) -> str:
+    if n < 20:
+        return ONES[n]
+    if n < 100:
+        tens, ones = divmod(n, 10)
+        return TENS[tens] + (f"-{ONES[ones]}" if ones else "")
+    if n < 1000:
+        hundreds, rest = divmod(n, 100)
+        return f"{ONES[hundreds]} hundred" + (f" {number_to_words(rest)}" if rest else "")
+    for value, name in SCALES:
+        if n >= value:
+            head, rest = divmod(n, value)
+            return f"{number_to_words(head)} {name}" + (f" {number_to_words(rest)}" if rest else "")
+    return str(n)
+
+
+def ordinal_to_words(n: int) -> str:
+    words = number_to_words(n)
+    head, _, last = words.rpartition(" ")
+    prefix, dash, unit = last.rpartition("-")
+    if unit in ORDINAL_WORDS:
+        unit = ORDINAL_WORDS[unit]
+    elif unit.endswith("y"):
+        unit = unit[:-1] + "ieth"
+    else:
+        unit += "th"
+    return (f"{head} " if head else "") + prefix + dash + unit
+
+
+def year_to_words(n: int) -> str:
+    if 2000 <= n < 2010 or not 1100 <= n < 2100:
+        return number_to_words(n)
+    century, rest = divmod(n, 100)
+    if rest == 0:
+        return f"{number_to_words(century)} hundred"
+    return f"{number_to_words(century)} " + (f"oh {ONES[rest]}" if rest < 10 else number_to_words(rest))
+
+
+def decimal_to_words(text: str) -> str:
+    whole, _, fraction = text.replace(",", "").partition(".")
+    words = number_to_words(int(whole))
+    if fraction:
+        words += " point " + " ".join(ONES[int(digit)] for digit in fraction)
+    return words
+
+
+def digits_to_words(text: str) -> str:
+    return " ".join(ONES[int(digit)] for digit in text)
+
+
+def plural_words(words: str) -> str:
+    return words[:-1] + "ies" if words.endswith("y") else words + "s"
+
+
+def amount_to_words(text: str) -> str:
+    """Plain numbers.
+
+    Standalone four digit values read as years. Values with a leading zero
+    ("007") and service numbers ("911") read digit by digit; everything else
+    is a quantity.
+    """
+    if "," not in text and "." not in text:
+        if len(text) == 4:
+            return year_to_words(int(text))
+        if (len(text) > 1 and text[0] == "0") or text in SPOKEN_AS_DIGITS:
+            return digits_to_words(text)
+    return decimal_to_words(text)
+
+
+def model_to_words(word: str, value: str) -> str:
+    """Three digit numbers after a name read digit by digit ("Boeing 737").
+
+    Round hundreds stay quantities ("Fortune 500").
+    """
+    if word.lower() in QUANTITY_LEAD_WORDS or value.endswith("00"):
+        return f"{word} {amount_to_words(value)}"
+    return f"{word} {digits_to_words(value)}"
+
+
+def decade_to_words(year: Optional[str], short: Optional[str]) -> str:
+    """1990s -> nineteen nineties, 2000s -> two thousands, '80s -> eighties."""
+    if short:
+        return plural_words(number_to_words(int(short)))
+    n = int(year)
+    century, rest = divmod(n, 100)
+    if n % 1000 == 0:
+        return plural_words(number_to_words(n))
+    if rest == 0:
+        return f"{number_to_words(century)} hundreds"
+    return f"{number_to_words(century)} {plural_words(number_to_words(rest))}"
+
+
+def slash_to_words(left: str, right: str) -> str:
+    """1/2 -> one half, 3/4 -> three quarters; other pairs read as-is (24/7, 9/11)."""
+    numerator, denominator = int(left), int(right)
+    if not 0 < numerator < denominator <= 10:
+        return f"{number_to_words(numerator)} {number_to_words(denominator)}"
+    if denominator == 2:
+        unit = "half" if numerator == 1 else "halves"
+    else:
+        unit = "quarter" if denominator == 4 else ordinal_to_words(denominator)
+        if numerator > 1:
+            unit += "s"
+    return f"{number_to_words(numerator)} {unit}"
+
+
+def currency_to_words(symbol: str, amount: str, magnitude: Optional[str]) -> str:
+    singular, plural, minor_singular, minor_plural = CURRENCIES[symbol]
+    if magnitude:
+        magnitude = MAGNITUDES.get(magnitude.lower(), magnitude)
+        return f"{decimal_to_words(amount)} {magnitude} {plural}"
+
+    whole, _, fraction = amount.replace(",", "").partition(".")
+    major = int(whole)
+    words = f"{number_to_words(major)} {singular if major == 1 else plural}"
+    if len(fraction) == 2 and int(fraction):
+        minor = int(fraction)
+        words += f" and {number_to_words(minor)} {minor_singular if minor == 1 else minor_plural}"
+    elif fraction and len(fraction) != 2:
+        words = f"{decimal_to_words(amount)} {plural}"
+    return words
+
+
+def date_to_words(month: str, day: str, year: Optional[str]) -> str:
+    words = f"{month} {ordinal_to_words(int(day))}"
+    if year:
+        words += f", {year_to_words(int(year))}"
+    return words
+
+
+class NewsSpeechNormalizer(BaseTextFilter):
+    """Single-pass streaming text filter that turns news text into speakable words."""
+
+    def __init__(self):
+        self._in_code_block = False
+
+    async def update_settings(self, settings: Mapping[str, Any]):
+        pass
+
+    async def filter(self, text: str) -> str:
+        return self.normalize(text)
+
+    async def handle_interruption(self):
+        self._in_code_block = False
+
+    async def reset_interruption(self):
+        pass
+
+    def normalize(self, text: str) -> str:
+        if self._in_code_block:
+            end = text.find("```")
+            if end < 0:
+                return ""
+            self._in_code_block = False
+            text = text[end + 3:]
+        return TOKEN_PATTERN.sub(self._replace, text)
+
+    def _replace(self, match: re.Match) -> str:
+        kind = match.lastgroup
+        group = match.group
+
+        if kind == "code_open":
+            self._in_code_block = True
+            return ""
+        if kind == "link":
+            return group("link_text")
+        if kind == "url":
+            return group("url_host")
+        if kind == "currency":
+            return currency_to_words(group("symbol"), group("amount"), group("magnitude"))
+        if kind == "minus":
+            return "minus "
+        if kind == "decade":
+            return decade_to_words(group("decade_year"), group("decade_short"))
+        if kind == "model":
+            return model_to_words(group("model_word"), group("model_value"))
+        if kind == "slash":
+            return slash_to_words(group("slash_left"), group("slash_right"))
+        if kind == "percent":
+            return f"{decimal_to_words(group('percent_value'))} percent"
+        if kind == "iso_date":
+            return date_to_words(MONTHS[int(group("iso_month")) - 1], group("iso_day"), group("iso_year"))
+        if kind == "date":
+            month = group("month")
+            return date_to_words(MONTH_ABBREVIATIONS.get(month.rstrip("."), month), group("day"), group("year"))
+        if kind == "time":
+            minute = int(group("minute"))
+            words = number_to_words(int(group("hour")))
+            if minute:
+                words += f" oh {ONES[minute]}" if minute < 10 else f" {number_to_words(minute)}"
+            if group("meridiem"):
+                words += f" {group('meridiem').upper()} M"
+            return words
+        if kind == "ordinal":
+            return ordinal_to_words(int(group("ordinal_value")))
+        if kind == "quarter":
+            return f"{ordinal_to_words(int(group('quarter_value')))} quarter"
+        if kind == "number_sign":
+            return "number"
+        if kind == "abbreviation":
+            return ABBREVIATIONS[match.group(0)]
+        if kind == "number":
+            return amount_to_words(match.group(0))
+        if kind == "pipe":
+            return " "
+        # code_block, html and markdown markers are dropped
+        return ""
@@ -1,11 +1,11 @@
 from loguru import logger
 from pipecat.services.ai_services import TTSService
-from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
+from services.speech_normalizer import NewsSpeechNormalizer
 from utils.settings import settings
 
 
 def create_tts_service() -> TTSService:
-    text_filters = [MarkdownTextFilter()]
+    text_filters = [NewsSpeechNormalizer()]
     provider = settings.tts_provider
 
     logger.info(f"Creating TTS service: {provider}")
@@ -21,6 +21,9 @@ class VoiceBackendSettings(BaseSettings):
         default="cartesia", alias="TTS_PROVIDER"
     )
 
+    opus_enabled: bool = Field(default=True, alias="OPUS_ENABLED")
+    opus_bitrate: int = Field(default=24000, alias="OPUS_BITRATE")
+
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
     deepgram_api_key: str = Field(default="", alias="DEEPGRAM_API_KEY")
     daily_api_key: str = Field(default="", alias="DAILY_API_KEY")
@@ -31,6 +34,14 @@ class VoiceBackendSettings(BaseSettings):
     chat_backend_port: int = Field(default=8000, alias="CHAT_BACKEND_PORT")
     chat_timeout: int = Field(default=60, alias="CHAT_TIMEOUT")
 
+    speculative_enabled: bool = Field(default=False, alias="SPECULATIVE_ENABLED")
+    speculative_stable_interims: int = Field(default=2, alias="SPECULATIVE_STABLE_INTERIMS")
+    speculative_min_words: int = Field(default=3, alias="SPECULATIVE_MIN_WORDS")
+
+    log_level: str = Field(default="DEBUG", alias="LOG_LEVEL")
+    log_chunk_sample_rate: float = Field(default=0.01, alias="LOG_CHUNK_SAMPLE_RATE")
+    log_request_sample_rate: float = Field(default=1.0, alias="LOG_REQUEST_SAMPLE_RATE")
+
     model_config = SettingsConfigDict(
         env_file=str(dotenv_path) if dotenv_path.exists() else None,
         case_sensitive=False,